@@ -1,6 +1,8 @@
 
 from xml.etree import ElementTree as ET
 
+import pytest
+
 from wn import lmf
 
 
@@ -71,6 +73,38 @@ def test_load_1_1(mini_lmf_1_1):
     assert lexicon.get('extends') == {'id': 'test-en', 'version': '1'}
 
 
+def test_load_invalid_count(tmp_path):
+    # str.isdigit() alone is not a safe integer check ('²'.isdigit() is
+    # True); malformed counts warn and load as 0 instead of raising
+    src = tmp_path / 'invalid-count.xml'
+    src.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<!DOCTYPE LexicalResource SYSTEM'
+        ' "http://globalwordnet.github.io/schemas/WN-LMF-1.0.dtd">\n'
+        '<LexicalResource xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+        '  <Lexicon id="test-count" label="Testing Counts" language="en"\n'
+        '           email="maintainer@example.com"\n'
+        '           license="https://creativecommons.org/licenses/by/4.0/"\n'
+        '           version="1">\n'
+        '    <LexicalEntry id="test-count-foo-n">\n'
+        '      <Lemma writtenForm="foo" partOfSpeech="n"/>\n'
+        '      <Sense id="test-count-foo-n-0001-01" synset="test-count-0001-n">\n'
+        '        <Count>²</Count>\n'
+        '        <Count>n/a</Count>\n'
+        '        <Count>3</Count>\n'
+        '      </Sense>\n'
+        '    </LexicalEntry>\n'
+        '    <Synset id="test-count-0001-n" ili="in"/>\n'
+        '  </Lexicon>\n'
+        '</LexicalResource>\n',
+        encoding='utf-8',
+    )
+    with pytest.warns(lmf.LMFWarning):
+        resource = lmf.load(src)
+    counts = resource['lexicons'][0]['entries'][0]['senses'][0]['counts']
+    assert [cnt['value'] for cnt in counts] == [0, 0, 3]
+
+
 def test_dump(mini_lmf_1_0, mini_lmf_1_1, tmp_path):
     tmpdir = tmp_path / 'test_dump'
     tmpdir.mkdir()
@@ -21,10 +21,11 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import TypedDict, Literal
 import re
+import warnings
+from functools import lru_cache
 from pathlib import Path
-import xml.etree.ElementTree as ET  # for general XML parsing
 import xml.parsers.expat  # for fast scanning of Lexicon versions
-from xml.sax.saxutils import quoteattr
+from xml.sax.saxutils import escape
 
 import wn
 from wn._types import AnyPath, VersionInfo
@@ -143,6 +144,17 @@ _CDATA_ELEMS = {  # elements with inner text
     'Example',
     'Count',
 }
+_INTERN_ATTRS = {  # attributes with values drawn from small vocabularies
+    'partOfSpeech',
+    'relType',
+    'language',
+    'script',
+    'category',
+    'adjposition',
+    'lexfile',
+    'synset',
+    'target',
+}
 _META_ELEMS = {  # elements with metadata
     'Lexicon',
     'LexicalEntry',
@@ -418,15 +430,14 @@ def load(
     if progress_handler is None:
         progress_handler = ProgressHandler
 
-    version, num_elements = _quick_scan(source)
-    progress = progress_handler(
-        message='Read', total=num_elements, refresh_interval=10000
-    )
-
     root: Dict[str, _Elem] = {}
-    parser = _make_parser(root, version, progress)
-
-    with open(source, 'rb') as fh:
+    with source.open('rb') as fh:
+        version, num_elements = _quick_scan(fh)
+        progress = progress_handler(
+            message='Read', total=num_elements, refresh_interval=10000
+        )
+        parser = _make_parser(root, version, progress)
+        fh.seek(0)
         try:
             parser.ParseFile(fh)
         except xml.parsers.expat.ExpatError as exc:
@@ -443,50 +454,96 @@ def load(
     return resource
 
 
-def _quick_scan(source: Path) -> Tuple[str, int]:
-    with source.open('rb') as fh:
-        version = _read_header(fh)
-        # _read_header() only reads the first 2 lines
-        remainder = fh.read()
-        num_elements = remainder.count(b'</') + remainder.count(b'/>')
+def _quick_scan(fh: BinaryIO) -> Tuple[str, int]:
+    version = _read_header(fh)
+    # _read_header() only reads the first 2 lines; count the remaining
+    # elements in fixed-size chunks to keep memory flat
+    num_elements = 0
+    tail = b''
+    while True:
+        chunk = fh.read(1 << 20)
+        if not chunk:
+            break
+        num_elements += chunk.count(b'</') + chunk.count(b'/>')
+        # patterns split across a chunk boundary
+        if (tail == b'<' and chunk[:1] == b'/') \
+           or (tail == b'/' and chunk[:1] == b'>'):
+            num_elements += 1
+        tail = chunk[-1:]
     return version, num_elements
 
 
 def _make_parser(root, version, progress):  # noqa: C901
+    # specialize the handlers for *version* by binding everything they
+    # consult, including method lookups, as local constants; ELEM_INFO
+    # folds every per-element question (child key, list-collected,
+    # character data, metadata, external) into a single dict lookup
     stack = [root]
     ELEMS = _VALID_ELEMS[version]
     NS_ATTRS = _NS_ATTRS[version]
-    CDATA_ELEMS = _CDATA_ELEMS & set(ELEMS)
-    LIST_ELEMS = _LIST_ELEMS & set(ELEMS)
+    NS_ATTR_KEYS = frozenset(NS_ATTRS)
+    ELEM_INFO = {
+        name: (
+            key,
+            name in _LIST_ELEMS,
+            name in _CDATA_ELEMS,
+            name in _META_ELEMS,
+            name.startswith('External'),
+        )
+        for name, key in ELEMS.items()
+    }
+    INTERN_ATTRS = _INTERN_ATTRS
+    intern = sys.intern
+    stack_append = stack.append
+    stack_pop = stack.pop
+    update_progress = progress.update
 
     p = xml.parsers.expat.ParserCreate(namespace_separator=' ')
+    # buffer character data so the handler is called once per text node
+    # in the common case instead of once per parse buffer
+    p.buffer_text = True
     has_text = False
 
     def start(name, attrs):
         nonlocal has_text
-        if name in CDATA_ELEMS:
+        info = ELEM_INFO.get(name)
+        if info is None:
+            raise _unexpected(name, p)
+        key, is_list, has_cdata, has_meta, is_external = info
+        if has_cdata:
             has_text = True
 
-        if name in _META_ELEMS:
-            meta = {}
-            for attr in list(attrs):
-                if attr in NS_ATTRS:
-                    meta[NS_ATTRS[attr]] = attrs.pop(attr)
-            attrs['meta'] = meta or None
+        # intern ids and closed-vocabulary values so a large wordnet
+        # shares one string object per distinct value
+        for attr in INTERN_ATTRS.intersection(attrs):
+            attrs[attr] = intern(attrs[attr])
+
+        if has_meta:
+            meta_attrs = NS_ATTR_KEYS.intersection(attrs)
+            if meta_attrs:
+                # iterate the namespace table, not the (hash-ordered)
+                # intersection, so the meta dict keeps canonical order
+                attrs['meta'] = {NS_ATTRS[attr]: attrs.pop(attr)
+                                 for attr in NS_ATTRS if attr in meta_attrs}
+            else:
+                attrs['meta'] = None
 
-        if name.startswith('External'):
+        if is_external:
             attrs['external'] = True
 
         parent = stack[-1]
-        key = ELEMS.get(name)
-        if name in LIST_ELEMS:
-            parent.setdefault(key, []).append(attrs)
-        elif key is None or key in parent:
+        if is_list:
+            siblings = parent.get(key)
+            if siblings is None:
+                parent[key] = [attrs]
+            else:
+                siblings.append(attrs)
+        elif key in parent:
             raise _unexpected(name, p)
         else:
             parent[key] = attrs
 
-        stack.append(attrs)
+        stack_append(attrs)
 
     def char_data(data):
         if has_text:
@@ -501,8 +558,8 @@ def _make_parser(root, version, progress):  # noqa: C901
     def end(name):
         nonlocal has_text
         has_text = False
-        stack.pop()
-        progress.update(force=(name == 'LexicalResource'))
+        stack_pop()
+        update_progress(force=(name == 'LexicalResource'))
 
     p.StartElementHandler = start
     p.EndElementHandler = end
@@ -517,6 +574,18 @@ def _unexpected(name: str, p: xml.parsers.expat.XMLParserType) -> LMFError:
 
 # Validation ###########################################################
 
+# boolean attributes default to true unless the value is exactly 'false'
+_BOOL_VALUES = {'true': True, 'false': False}
+
+
+def _get_count(text: str) -> int:
+    try:
+        return int(text)
+    except ValueError:
+        warnings.warn(f'invalid count value: {text!r}', LMFWarning)
+        return 0
+
+
 def _validate(elem: _Elem) -> Union[Lexicon, LexiconExtension]:
     ext = elem.get('extends')
     if ext:
@@ -568,7 +637,7 @@ def _validate_forms(elems: List[_Elem], extension: bool) -> None:
         for pron in elem.get('pronunciations', []):
             pron.setdefault('text', '')
             if pron.get('phonemic'):
-                pron['phonemic'] = False if pron['phonemic'] == 'false' else True
+                pron['phonemic'] = _BOOL_VALUES.get(pron['phonemic'], True)
         for tag in elem.get('tags', []):
             tag.setdefault('text', '')
             assert 'category' in tag
@@ -591,10 +660,10 @@ def _validate_senses(elems: List[_Elem], extension: bool) -> None:
             ex.setdefault('meta')
         for cnt in elem.get('counts', []):
             assert 'text' in cnt
-            cnt['value'] = int(cnt.pop('text'))
+            cnt['value'] = _get_count(cnt.pop('text'))
             cnt.setdefault('meta')
         if elem.get('lexicalized'):
-            elem['lexicalized'] = False if elem['lexicalized'] == 'false' else True
+            elem['lexicalized'] = _BOOL_VALUES.get(elem['lexicalized'], True)
         if elem.get('subcat'):
             elem['subcat'] = elem['subcat'].split()
 
@@ -625,7 +694,7 @@ def _validate_synsets(elems: List[_Elem], extension: bool) -> None:
             ex.setdefault('text', '')
             ex.setdefault('meta')
         if elem.get('lexicalized'):
-            elem['lexicalized'] = False if elem['lexicalized'] == 'false' else True
+            elem['lexicalized'] = _BOOL_VALUES.get(elem['lexicalized'], True)
         if elem.get('members'):
             elem['members'] = elem['members'].split()
 
@@ -637,6 +706,9 @@ def _validate_metadata(elem: _Elem) -> None:
 
 # Serialization ########################################################
 
+_WRITE_BATCH = 1024  # number of formatted elements joined per write
+
+
 def dump(resource: LexicalResource, destination: AnyPath) -> None:
     """Write wordnets in the WN-LMF format.
 
@@ -668,29 +740,41 @@ def _dump_lexicon(
     attrib = _build_lexicon_attrib(lexicon, version)
     attrdelim = '\n' + (' ' * len(f'  <{lexicontype} '))
     attrs = attrdelim.join(
-        f'{attr}={quoteattr(str(val))}' for attr, val in attrib.items()
+        f'{attr}={_quoteattr(val)}' for attr, val in attrib.items()
     )
-    print(f'  <{lexicontype} {attrs}>', file=out)
+    # batch formatted elements so the file sees large writes instead of
+    # one small write per entry
+    parts = [f'  <{lexicontype} {attrs}>\n']
 
     if version >= (1, 1):
         if lexicontype == 'LexiconExtension':
             assert lexicon.get('extends')
             lexicon = cast(LexiconExtension, lexicon)
-            _dump_dependency(lexicon['extends'], 'Extends', out)
+            parts.append(_format_dependency(lexicon['extends'], 'Extends', 2))
         for req in lexicon.get('requires', []):
-            _dump_dependency(req, 'Requires', out)
+            parts.append(_format_dependency(req, 'Requires', 2))
 
     for entry in lexicon.get('entries', []):
-        _dump_lexical_entry(entry, out, version)
+        parts.append(_format_lexical_entry(entry, version, 2))
+        if len(parts) >= _WRITE_BATCH:
+            out.write(''.join(parts))
+            parts.clear()
 
     for synset in lexicon.get('synsets', []):
-        _dump_synset(synset, out, version)
+        parts.append(_format_synset(synset, version, 2))
+        if len(parts) >= _WRITE_BATCH:
+            out.write(''.join(parts))
+            parts.clear()
 
     if version >= (1, 1):
         for sb in lexicon.get('frames', []):
-            _dump_syntactic_behaviour(sb, out, version)
+            parts.append(_format_syntactic_behaviour(sb, version, 2))
+            if len(parts) >= _WRITE_BATCH:
+                out.write(''.join(parts))
+                parts.clear()
 
-    print(f'  </{lexicontype}>', file=out)
+    parts.append(f'  </{lexicontype}>\n')
+    out.write(''.join(parts))
 
 
 def _build_lexicon_attrib(
@@ -715,85 +799,90 @@ def _build_lexicon_attrib(
     return attrib
 
 
-def _dump_dependency(
-    dep: Dependency, deptype: str, out: TextIO
-) -> None:
+def _format_dependency(dep: Dependency, deptype: str, level: int) -> str:
     attrib = {'id': dep['id'], 'version': dep['version']}
     if dep.get('url'):
         attrib['url'] = dep['url']
-    elem = ET.Element(deptype, attrib=attrib)
-    print(_tostring(elem, 2), file=out)
+    return _format_element(deptype, attrib, [], level)
 
 
-def _dump_lexical_entry(
+def _format_lexical_entry(
     entry: Union[LexicalEntry, ExternalLexicalEntry],
-    out: TextIO,
     version: VersionInfo,
-) -> None:
-    frames = []
+    level: int,
+) -> str:
+    frames: List[str] = []
     attrib = {'id': entry['id']}
+    body: List[str] = []
     if entry.get('external', False):
-        elem = ET.Element('ExternalLexicalEntry', attrib=attrib)
+        elemtype = 'ExternalLexicalEntry'
         if entry.get('lemma'):
             assert entry['lemma'].get('external', False)
-            elem.append(_build_lemma(entry['lemma'], version))
+            body.append(_format_lemma(entry['lemma'], version, level + 1))
     else:
         entry = cast(LexicalEntry, entry)
         attrib.update(_meta_dict(entry.get('meta')))
-        elem = ET.Element('LexicalEntry', attrib=attrib)
-        elem.append(_build_lemma(entry['lemma'], version))
+        elemtype = 'LexicalEntry'
+        body.append(_format_lemma(entry['lemma'], version, level + 1))
         if version < (1, 1):
-            frames = [_build_syntactic_behaviour(sb, version)
+            frames = [_format_syntactic_behaviour(sb, version, level + 1)
                       for sb in entry.get('frames', [])]
-    elem.extend([_build_form(form, version) for form in entry.get('forms', [])])
-    elem.extend([_build_sense(sense, version)
-                 for sense in entry.get('senses', [])])
-    elem.extend(frames)
-    print(_tostring(elem, 2), file=out)
+    body.extend(_format_form(form, version, level + 1)
+                for form in entry.get('forms', []))
+    body.extend(_format_sense(sense, version, level + 1)
+                for sense in entry.get('senses', []))
+    body.extend(frames)
+    return _format_element(elemtype, attrib, body, level)
 
 
-def _build_lemma(
+def _format_lemma(
     lemma: Union[Lemma, ExternalLemma],
-    version: VersionInfo
-) -> ET.Element:
+    version: VersionInfo,
+    level: int,
+) -> str:
+    attrib: Dict[str, str] = {}
     if lemma.get('external', False):
-        elem = ET.Element('ExternalLemma')
+        elemtype = 'ExternalLemma'
     else:
         lemma = cast(Lemma, lemma)
-        attrib = {'writtenForm': lemma['writtenForm']}
+        elemtype = 'Lemma'
+        attrib['writtenForm'] = lemma['writtenForm']
         if lemma.get('script'):
             attrib['script'] = lemma['script']
         attrib['partOfSpeech'] = lemma['partOfSpeech']
-        elem = ET.Element('Lemma', attrib=attrib)
+    body: List[str] = []
     if version >= (1, 1):
-        for pron in lemma.get('pronunciations', []):
-            elem.append(_build_pronunciation(pron))
-    for tag in lemma.get('tags', []):
-        elem.append(_build_tag(tag))
-    return elem
+        body.extend(_format_pronunciation(pron, level + 1)
+                    for pron in lemma.get('pronunciations', []))
+    body.extend(_format_tag(tag, level + 1) for tag in lemma.get('tags', []))
+    return _format_element(elemtype, attrib, body, level)
 
 
-def _build_form(form: Union[Form, ExternalForm], version: VersionInfo) -> ET.Element:
+def _format_form(
+    form: Union[Form, ExternalForm],
+    version: VersionInfo,
+    level: int,
+) -> str:
     attrib = {}
-    if version >= (1, 1) and form['id']:
+    if version >= (1, 1) and form.get('id'):
         attrib['id'] = form['id']
     if form.get('external', False):
-        elem = ET.Element('ExternalForm', attrib=attrib)
+        elemtype = 'ExternalForm'
     else:
         form = cast(Form, form)
+        elemtype = 'Form'
         attrib['writtenForm'] = form['writtenForm']
         if form.get('script'):
             attrib['script'] = form['script']
-        elem = ET.Element('Form', attrib=attrib)
+    body: List[str] = []
     if version >= (1, 1):
-        for pron in form.get('pronunciations', []):
-            elem.append(_build_pronunciation(pron))
-    for tag in form.get('tags', []):
-        elem.append(_build_tag(tag))
-    return elem
+        body.extend(_format_pronunciation(pron, level + 1)
+                    for pron in form.get('pronunciations', []))
+    body.extend(_format_tag(tag, level + 1) for tag in form.get('tags', []))
+    return _format_element(elemtype, attrib, body, level)
 
 
-def _build_pronunciation(pron: Pronunciation) -> ET.Element:
+def _format_pronunciation(pron: Pronunciation, level: int) -> str:
     attrib = {}
     if pron.get('variety'):
         attrib['variety'] = pron['variety']
@@ -803,26 +892,25 @@ def _build_pronunciation(pron: Pronunciation) -> ET.Element:
         attrib['phonemic'] = 'false'
     if pron.get('audio'):
         attrib['audio'] = pron['audio']
-    elem = ET.Element('Pronunciation', attrib=attrib)
-    elem.text = pron['text']
-    return elem
+    return _format_text_element('Pronunciation', attrib, pron['text'], level)
 
 
-def _build_tag(tag: Tag) -> ET.Element:
-    elem = ET.Element('Tag', category=tag['category'])
-    elem.text = tag['text']
-    return elem
+def _format_tag(tag: Tag, level: int) -> str:
+    return _format_text_element('Tag', {'category': tag['category']},
+                                tag['text'], level)
 
 
-def _build_sense(
+def _format_sense(
     sense: Union[Sense, ExternalSense],
     version: VersionInfo,
-) -> ET.Element:
+    level: int,
+) -> str:
     attrib = {'id': sense['id']}
     if sense.get('external'):
-        elem = ET.Element('ExternalSense', attrib=attrib)
+        elemtype = 'ExternalSense'
     else:
         sense = cast(Sense, sense)
+        elemtype = 'Sense'
         attrib['synset'] = sense['synset']
         attrib.update(_meta_dict(sense.get('meta')))
         if not sense.get('lexicalized', True):
@@ -831,39 +919,39 @@ def _build_sense(
             attrib['adjposition'] = sense['adjposition']
         if version >= (1, 1) and sense.get('subcat'):
             attrib['subcat'] = ' '.join(sense['subcat'])
-        elem = ET.Element('Sense', attrib=attrib)
-    elem.extend([_build_relation(rel, 'SenseRelation')
-                 for rel in sense.get('relations', [])])
-    elem.extend([_build_example(ex) for ex in sense.get('examples', [])])
-    elem.extend([_build_count(cnt) for cnt in sense.get('counts', [])])
-    return elem
+    body = [_format_relation(rel, 'SenseRelation', level + 1)
+            for rel in sense.get('relations', [])]
+    body.extend(_format_example(ex, level + 1) for ex in sense.get('examples', []))
+    body.extend(_format_count(cnt, level + 1) for cnt in sense.get('counts', []))
+    return _format_element(elemtype, attrib, body, level)
 
 
-def _build_example(example: Example) -> ET.Element:
-    elem = ET.Element('Example')
-    elem.text = example['text']
+def _format_example(example: Example, level: int) -> str:
+    attrib = {}
     if example.get('language'):
-        elem.set('language', example['language'])
-    return elem
+        attrib['language'] = example['language']
+    return _format_text_element('Example', attrib, example['text'], level)
 
 
-def _build_count(count: Count) -> ET.Element:
-    elem = ET.Element('Count', attrib=_meta_dict(count.get('meta')))
-    elem.text = str(count['value'])
-    return elem
+def _format_count(count: Count, level: int) -> str:
+    return _format_text_element('Count', _meta_dict(count.get('meta')),
+                                str(count['value']), level)
 
 
-def _dump_synset(
+def _format_synset(
     synset: Union[Synset, ExternalSynset],
-    out: TextIO,
-    version: VersionInfo
-) -> None:
+    version: VersionInfo,
+    level: int,
+) -> str:
     attrib: Dict[str, str] = {'id': synset['id']}
+    body: List[str] = []
     if synset.get('external', False):
-        elem = ET.Element('ExternalSynset', attrib=attrib)
-        elem.extend([_build_definition(defn) for defn in synset.get('definitions', [])])
+        elemtype = 'ExternalSynset'
+        body.extend(_format_definition(defn, level + 1)
+                    for defn in synset.get('definitions', []))
     else:
         synset = cast(Synset, synset)
+        elemtype = 'Synset'
         attrib['ili'] = synset['ili']
         if synset.get('partOfSpeech'):
             attrib['partOfSpeech'] = synset['partOfSpeech']
@@ -875,111 +963,153 @@ def _dump_synset(
             if synset.get('lexfile'):
                 attrib['lexfile'] = synset['lexfile']
         attrib.update(_meta_dict(synset.get('meta')))
-        elem = ET.Element('Synset', attrib=attrib)
-        elem.extend([_build_definition(defn) for defn in synset.get('definitions', [])])
+        body.extend(_format_definition(defn, level + 1)
+                    for defn in synset.get('definitions', []))
         if synset.get('ili_definition'):
-            elem.append(_build_ili_definition(synset['ili_definition']))
-    elem.extend([_build_relation(rel, 'SynsetRelation')
-                 for rel in synset.get('relations', [])])
-    elem.extend([_build_example(ex) for ex in synset.get('examples', [])])
-    print(_tostring(elem, 2), file=out)
+            body.append(_format_ili_definition(synset['ili_definition'], level + 1))
+    body.extend(_format_relation(rel, 'SynsetRelation', level + 1)
+                for rel in synset.get('relations', []))
+    body.extend(_format_example(ex, level + 1) for ex in synset.get('examples', []))
+    return _format_element(elemtype, attrib, body, level)
 
 
-def _build_definition(definition: Definition) -> ET.Element:
+def _format_definition(definition: Definition, level: int) -> str:
     attrib = {}
     if definition.get('language'):
         attrib['language'] = definition['language']
     if definition.get('sourceSense'):
         attrib['sourceSense'] = definition['sourceSense']
     attrib.update(_meta_dict(definition.get('meta')))
-    elem = ET.Element('Definition', attrib=attrib)
-    elem.text = definition['text']
-    return elem
+    return _format_text_element('Definition', attrib, definition['text'], level)
 
 
-def _build_ili_definition(ili_definition: ILIDefinition) -> ET.Element:
-    elem = ET.Element('ILIDefinition', attrib=_meta_dict(ili_definition.get('meta')))
-    elem.text = ili_definition['text']
-    return elem
+def _format_ili_definition(ili_definition: ILIDefinition, level: int) -> str:
+    return _format_text_element('ILIDefinition',
+                                _meta_dict(ili_definition.get('meta')),
+                                ili_definition['text'], level)
 
 
-def _build_relation(relation: Relation, elemtype: str) -> ET.Element:
+def _format_relation(relation: Relation, elemtype: str, level: int) -> str:
+    # relations are the most numerous leaf elements and rarely carry
+    # metadata, so the common case is formatted in one step
+    meta = relation.get('meta')
+    if not meta:
+        return (f'{_INDENTS[level]}<{elemtype}'
+                f' target={_quoteattr(relation["target"])}'
+                f' relType={_quoteattr(relation["relType"])}/>\n')
     attrib = {'target': relation['target'], 'relType': relation['relType']}
-    attrib.update(_meta_dict(relation.get('meta')))
-    return ET.Element(elemtype, attrib=attrib)
+    attrib.update(_meta_dict(meta))
+    return _format_element(elemtype, attrib, [], level)
 
 
-def _dump_syntactic_behaviour(
+def _format_syntactic_behaviour(
     syntactic_behaviour: SyntacticBehaviour,
-    out: TextIO,
-    version: VersionInfo
-) -> None:
-    elem = _build_syntactic_behaviour(syntactic_behaviour, version)
-    print('    ' + _tostring(elem, 2), file=out)
+    version: VersionInfo,
+    level: int,
+) -> str:
+    # the same subcategorization frame recurs across many entries, so
+    # memoize on the (hashable) values that determine the output
+    if version >= (1, 1):
+        sb_id = syntactic_behaviour.get('id')
+        senses: Tuple[str, ...] = ()
+    else:
+        sb_id = None
+        senses = tuple(syntactic_behaviour.get('senses', ()))
+    return _format_syntactic_behaviour_cached(
+        syntactic_behaviour['subcategorizationFrame'], sb_id, senses, level
+    )
 
 
-def _build_syntactic_behaviour(
-    syntactic_behaviour: SyntacticBehaviour,
-    version: VersionInfo
-) -> ET.Element:
-    attrib = {'subcategorizationFrame': syntactic_behaviour['subcategorizationFrame']}
-    if version >= (1, 1) and syntactic_behaviour.get('id'):
-        attrib['id'] = syntactic_behaviour['id']
-    elif version < (1, 1) and syntactic_behaviour.get('senses'):
-        attrib['senses'] = ' '.join(syntactic_behaviour['senses'])
-    return ET.Element('SyntacticBehaviour', attrib=attrib)
+@lru_cache(maxsize=4096)
+def _format_syntactic_behaviour_cached(
+    frame: str,
+    sb_id: Optional[str],
+    senses: Tuple[str, ...],
+    level: int,
+) -> str:
+    attrib = {'subcategorizationFrame': frame}
+    if sb_id:
+        attrib['id'] = sb_id
+    elif senses:
+        attrib['senses'] = ' '.join(senses)
+    return _format_element('SyntacticBehaviour', attrib, [], level)
+
 
+# WN-LMF nesting depth is bounded by the schema, so precomputed indent
+# strings cover every level the formatters can be called with
+_INDENTS = tuple('  ' * level for level in range(8))
 
-def _tostring(
-        elem: ET.Element, level: int, short_empty_elements: bool = True
+
+def _format_element(
+    elemtype: str,
+    attrib: Dict[str, str],
+    body: List[str],
+    level: int,
 ) -> str:
-    _indent(elem, level)
-    return ('  ' * level) + ET.tostring(
-        elem,
-        encoding='unicode',
-        short_empty_elements=short_empty_elements
-    )
+    indent = _INDENTS[level]
+    attrs = _format_attrs(attrib)
+    if body:
+        return (f'{indent}<{elemtype}{attrs}>\n'
+                + ''.join(body)
+                + f'{indent}</{elemtype}>\n')
+    return f'{indent}<{elemtype}{attrs}/>\n'
+
+
+def _format_text_element(
+    elemtype: str,
+    attrib: Dict[str, str],
+    text: str,
+    level: int,
+) -> str:
+    indent = _INDENTS[level]
+    attrs = _format_attrs(attrib)
+    if text:
+        return f'{indent}<{elemtype}{attrs}>{escape(text)}</{elemtype}>\n'
+    return f'{indent}<{elemtype}{attrs}/>\n'
+
+
+_ATTR_SPECIALS = re.compile(r'[&<>"\n\r\t]').search
+_ATTR_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    '\n': '&#10;',
+    '\r': '&#13;',
+    '\t': '&#9;',
+})
+
+
+def _quoteattr(val: str) -> str:
+    # nearly all attribute values need no escaping; skip the translation
+    # when a single scan finds nothing to escape
+    if _ATTR_SPECIALS(val) is None:
+        return f'"{val}"'
+    return f'"{val.translate(_ATTR_ESCAPES)}"'
 
 
-def _indent(elem: ET.Element, level: int) -> None:
-    self_indent = '\n' + '  ' * level
-    child_indent = self_indent + '  '
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = child_indent
-        for child in elem[:-1]:
-            _indent(child, level + 1)
-            child.tail = child_indent
-        _indent(elem[-1], level + 1)
-        elem[-1].tail = self_indent
+def _format_attrs(attrib: Dict[str, str]) -> str:
+    return ''.join(f' {attr}={_quoteattr(val)}' for attr, val in attrib.items())
+
+
+# map metadata keys to their serialized attribute names; the computed
+# qnames are interned so their hashes are cached like literal keys
+_META_QNAMES = {attr: sys.intern(f'dc:{attr}') for attr in _DC_ATTRS}
+_META_QNAMES.update(status='status', note='note')
 
 
 def _meta_dict(meta: Optional[Metadata]) -> Dict[str, str]:
-    if meta is not None:
-        # Literal keys are required for typing purposes, so first
-        # construct the dict and then remove those that weren't specified.
-        d = {
-            'dc:contributor': meta.get('contributor', ''),
-            'dc:coverage': meta.get('coverage', ''),
-            'dc:creator': meta.get('creator', ''),
-            'dc:date': meta.get('date', ''),
-            'dc:description': meta.get('description', ''),
-            'dc:format': meta.get('format', ''),
-            'dc:identifier': meta.get('identifier', ''),
-            'dc:publisher': meta.get('publisher', ''),
-            'dc:relation': meta.get('relation', ''),
-            'dc:rights': meta.get('rights', ''),
-            'dc:source': meta.get('source', ''),
-            'dc:subject': meta.get('subject', ''),
-            'dc:title': meta.get('title', ''),
-            'dc:type': meta.get('type', ''),
-            'status': meta.get('status', ''),
-            'note': meta.get('note', ''),
-        }
-        d = {key: val for key, val in d.items() if val}
-        # this one requires a conversion, so do it separately
-        if 'confidenceScore' in meta:
-            d['confidenceScore'] = str(meta['confidenceScore'])
-    else:
-        d = {}
+    if not meta:
+        return {}
+    # iterate the qname table, not meta itself, so attributes serialize
+    # in canonical order whatever the metadata dict's insertion order
+    mget = cast(Dict[str, Any], meta).get
+    d: Dict[str, str] = {}
+    for key, qname in _META_QNAMES.items():
+        val = mget(key)
+        if val:
+            d[qname] = val
+    # this one requires a conversion
+    if 'confidenceScore' in meta:
+        d['confidenceScore'] = str(meta['confidenceScore'])
     return d
@@ -123,22 +123,26 @@ def _spurious_ili_definition(lex: lmf.Lexicon, ids: _Ids) -> _Result:
 
 def _missing_relation_target(lex: lmf.Lexicon, ids: _Ids) -> _Result:
     """relation target is missing or invalid"""
+    sense_ids = ids['sense']
+    synset_ids = ids['synset']
     result = {s['id']: {'type': r['relType'], 'target': r['target']}
               for s, r in _sense_relations(lex)
-              if r['target'] not in ids['sense'] and r['target'] not in ids['synset']}
+              if r['target'] not in sense_ids and r['target'] not in synset_ids}
     result.update((ss['id'], {'type': r['relType'], 'target': r['target']})
                   for ss, r in _synset_relations(lex)
-                  if r['target'] not in ids['synset'])
+                  if r['target'] not in synset_ids)
     return result
 
 
 def _invalid_relation_type(lex: lmf.Lexicon, ids: _Ids) -> _Result:
     """relation type is invalid for the source and target"""
+    sense_ids = ids['sense']
+    synset_ids = ids['synset']
     result = {s['id']: {'type': r['relType'], 'target': r['target']}
               for s, r in _sense_relations(lex)
-              if (r['target'] in ids['sense']
+              if (r['target'] in sense_ids
                   and r['relType'] not in SENSE_RELATIONS)
-              or (r['target'] in ids['synset']
+              or (r['target'] in synset_ids
                   and r['relType'] not in SENSE_SYNSET_RELATIONS)}
     result.update((ss['id'], {'type': r['relType'], 'target': r['target']})
                   for ss, r in _synset_relations(lex)